@@ -1,4 +1,5 @@
 import numpy as np  # Library for array handling
+from numba import njit  # JIT compiler for the hot board-scanning loops
 import random       # Library for random number generation
 from tkinter import *          # GUI library
 from tkinter import messagebox  # For popup message dialogs (info, alerts, etc.)
@@ -7,6 +8,49 @@ from tkinter import messagebox  # For popup message dialogs (info, alerts, etc.)
 BOARD_DIM = 15  # Board size 15x15
 EMPTY, BLACK, WHITE = 0, 1, -1  # Represent empty cell, black piece (human), white piece (AI)
 AI_DEPTH = 2  # Depth for AI search algorithms
+WIN_SCORE = 1_000_000  # Score of a won position for the winner
+
+# Center weight of each cell, (7 - |7 - r|) * (7 - |7 - c|): higher closer to the center
+_center_dist = BOARD_DIM//2 - np.abs(np.arange(BOARD_DIM) - BOARD_DIM//2)
+CENTER_WEIGHT = (_center_dist[:, None] * _center_dist[None, :]).astype(np.int32)
+
+# Move ordering priority for a run of 0..4 pieces a move would extend (own runs count double)
+RUN_PRIORITY = (0, 10, 100, 1000, 10000)
+
+def build_lines(length):
+    # Precompute every on-board line of the given length as one row of flat cell indices:
+    # [cell before the line, the line's cells..., cell after the line], with -1 for cells off the board
+    lines = []
+    for dr, dc in [(1, 0), (0, 1), (1, 1), (1, -1)]:
+        for r in range(BOARD_DIM):
+            for c in range(BOARD_DIM):
+                cells = [(r + dr*i, c + dc*i) for i in range(-1, length + 1)]
+                if not all(0 <= nr < BOARD_DIM and 0 <= nc < BOARD_DIM for nr, nc in cells[1:-1]):
+                    continue  # Line runs off the board
+                lines.append([nr*BOARD_DIM + nc if 0 <= nr < BOARD_DIM and 0 <= nc < BOARD_DIM else -1
+                              for nr, nc in cells])
+    return np.array(lines, dtype=np.int16)
+
+LINES_2, LINES_3, LINES_4 = build_lines(2), build_lines(3), build_lines(4)
+
+# Bitboards: one Python int per color, bit r*BB_STRIDE + c set where that color has a piece
+# Each row gets one extra always-empty guard bit so shifted runs cannot wrap onto the next row
+BB_STRIDE = BOARD_DIM + 1
+BB_SHIFTS = (1, BB_STRIDE, BB_STRIDE + 1, BB_STRIDE - 1)  # horizontal, vertical, diagonal right-down, diagonal left-down
+
+# Zobrist hashing: one random 63-bit key per (cell, color), XORed together to hash a board.
+# The keys come from a fixed seed, so every run and every process hashes a board the same way
+ZOBRIST_SEED = 0x5EED
+ZOBRIST = np.random.default_rng(ZOBRIST_SEED).integers(0, 2**63, size=(BOARD_DIM, BOARD_DIM, 2), dtype=np.uint64).tolist()
+
+# Transposition table for Alpha-Beta: (hash, ai_player, current) -> (value, depth, flag, best_move)
+TT_EXACT, TT_LOWER, TT_UPPER = 0, 1, 2  # Stored value is exact, a lower bound, or an upper bound
+TT_MAX_SIZE = 1 << 20  # Evict the oldest entry once the table grows past this
+transposition_table = {}
+
+# Cache of heuristic scores for leaf boards: (board bytes, ai_player) -> score
+EVAL_CACHE_MAX_SIZE = 200_000  # Clear the cache once it grows past this
+eval_cache = {}
 
 def clear_widgets(window):
     # Clear all widgets inside the given window, to refresh UI easily
@@ -45,148 +89,279 @@ def build_main_menu(root):
 
 def init_board():
     # Initialize the game board as a 15x15 numpy array filled with EMPTY cells
-    return np.zeros((BOARD_DIM, BOARD_DIM), dtype=int)
-
-def get_valid_moves(board):
-    # Generate all valid moves on the board (cells adjacent to any existing pieces)
-    possible_moves = set()
-    for r in range(BOARD_DIM):
-        for c in range(BOARD_DIM):
-            if board[r, c] != EMPTY:
-                # Check neighboring cells (8 directions)
-                for dr in range(-1, 2):
-                    for dc in range(-1, 2):
-                        nr, nc = r+dr, c+dc
-                        if 0 <= nr < BOARD_DIM and 0 <= nc < BOARD_DIM and board[nr, nc] == EMPTY:
-                            possible_moves.add((nr, nc))
-    # If no pieces on board, return center position
-    return list(possible_moves) if possible_moves else [(BOARD_DIM//2, BOARD_DIM//2)]
+    # int8 is enough for EMPTY/BLACK/WHITE and keeps the board at 225 bytes
+    return np.zeros((BOARD_DIM, BOARD_DIM), dtype=np.int8)
+
+def init_neighbors():
+    # Initialize the neighbor grid: for each cell, how many pieces lie in its 3x3 neighborhood
+    return np.zeros((BOARD_DIM, BOARD_DIM), dtype=np.int8)
+
+def init_stones():
+    # Initialize the piece counts, indexed by player: stones[BLACK] and stones[WHITE] (WHITE = -1 is the last slot)
+    return np.zeros(3, dtype=np.int16)
+
+def board_hash(board):
+    # Compute the Zobrist hash of a whole board from scratch
+    key = 0
+    for r, c in np.argwhere(board != EMPTY).tolist():
+        key ^= ZOBRIST[r][c][0 if board.item(r, c) == BLACK else 1]
+    return key
+
+def do_move(board, nbrs, stones, move, player, key=0):
+    # Place a piece, count it as a neighbor of every cell around it and in the player's stones, returns the updated hash
+    r, c = move
+    board[r, c] = player
+    stones[player] += 1
+    nbrs[max(0, r-1):r+2, max(0, c-1):c+2] += 1
+    return key ^ ZOBRIST[r][c][0 if player == BLACK else 1]
+
+def undo_move(board, nbrs, stones, move, key=0):
+    # Remove a piece placed by do_move and its neighbor and stone counts, returns the updated hash
+    r, c = move
+    player = board.item(r, c)
+    key ^= ZOBRIST[r][c][0 if player == BLACK else 1]
+    stones[player] -= 1
+    board[r, c] = EMPTY
+    nbrs[max(0, r-1):r+2, max(0, c-1):c+2] -= 1
+    return key
+
+def candidate_cells(board, nbrs):
+    # Valid moves as an (N, 2) array of (row, col): empty cells adjacent to any existing pieces
+    if not board.any():
+        # If no pieces on board, return center position
+        return np.array([[BOARD_DIM//2, BOARD_DIM//2]])
+    return np.argwhere((nbrs > 0) & (board == EMPTY))
+
+def get_valid_moves(board, nbrs):
+    # Generate all valid moves on the board as a list of (row, col) tuples
+    return [(r, c) for r, c in candidate_cells(board, nbrs).tolist()]
+
+def to_bitboard(board, player):
+    # Pack the player's pieces into a bitboard (see BB_STRIDE for the layout)
+    cells = np.zeros((BOARD_DIM, BB_STRIDE), dtype=bool)
+    cells[:, :BOARD_DIM] = board == player
+    return int.from_bytes(np.packbits(cells.ravel(), bitorder='little').tobytes(), 'little')
+
+def has_five(bb):
+    # Check a bitboard for 5 in a row: AND the board with itself shifted 1..4 steps along each direction
+    for shift in BB_SHIFTS:
+        if bb & (bb >> shift) & (bb >> 2*shift) & (bb >> 3*shift) & (bb >> 4*shift):
+            return True
+    return False
 
 def has_winner(board, player):
     # Check if the given player has won by having 5 in a row
-    directions = [(1, 0), (0, 1), (1, 1), (1, -1)]  # vertical, horizontal, diagonal right-down, diagonal right-up
-    for dr, dc in directions:
-        for r in range(BOARD_DIM):
-            for c in range(BOARD_DIM):
-                try:
-                    # Check 5 consecutive positions in this direction
-                    if all(board[r + dr*i, c + dc*i] == player for i in range(5)):
-                        return True
-                except IndexError:
-                    continue  # Ignore out-of-bounds errors
+    if np.count_nonzero(board == player) < 5:
+        return False  # Too few pieces for a line of 5
+    return has_five(to_bitboard(board, player))
+
+@njit(cache=True)
+def has_winner_at(board, r, c, player, stones):
+    # Check if the piece at (r, c) completes 5 in a row for the player (only lines through this cell)
+    if stones[player] < 5:
+        return False  # Too few pieces for a line of 5
+    for dr, dc in ((1, 0), (0, 1), (1, 1), (1, -1)):
+        run = 1  # The piece at (r, c) itself
+        for sign in (1, -1):
+            # Walk outward in both directions until a mismatch or the board edge
+            nr, nc = r + sign*dr, c + sign*dc
+            while 0 <= nr < BOARD_DIM and 0 <= nc < BOARD_DIM and board[nr, nc] == player:
+                run += 1
+                nr, nc = nr + sign*dr, nc + sign*dc
+        if run >= 5:
+            return True
     return False
 
-def count_lines(board, player, length):
-    # Count number of lines of specific length for the player with at least one open end
+@njit(cache=True)
+def move_priority(board, r, c, player):
+    # Cheap heuristic for ordering moves: how long the player's and opponent's runs through (r, c) are
+    priority = CENTER_WEIGHT[r, c]
+    for dr, dc in ((1, 0), (0, 1), (1, 1), (1, -1)):
+        for who in (player, -player):
+            run = 0
+            for sign in (1, -1):
+                # Count contiguous pieces of this color next to (r, c), up to 4 cells away
+                for i in range(1, 5):
+                    nr, nc = r + sign*dr*i, c + sign*dc*i
+                    if not (0 <= nr < BOARD_DIM and 0 <= nc < BOARD_DIM) or board[nr, nc] != who:
+                        break
+                    run += 1
+            # Extending own runs (attack) weighs double blocking opponent runs (defense)
+            priority += RUN_PRIORITY[min(run, 4)] * (2 if who == player else 1)
+    return priority
+
+@njit(cache=True)
+def move_priorities(board, cells, player):
+    # Compute move_priority for every candidate cell in a single compiled pass
+    priorities = np.empty(len(cells), dtype=np.int64)
+    for i in range(len(cells)):
+        priorities[i] = move_priority(board, cells[i, 0], cells[i, 1], player)
+    return priorities
+
+@njit(cache=True)
+def count_lines(board, player, lines, stones):
+    # Count lines (rows of a LINES_* table) fully owned by the player with at least one open end
+    length = lines.shape[1] - 2
+    if stones[player] < length:
+        return 0  # Too few pieces for a line of this length
+    flat = board.ravel()
     count = 0
-    for dr, dc in [(1, 0), (0, 1), (1, 1), (1, -1)]:
-        for r in range(BOARD_DIM):
-            for c in range(BOARD_DIM):
-                try:
-                    line = [board[r + dr*i, c + dc*i] for i in range(length)]
-                    # Ensure all cells belong to player and no opponent pieces in line
-                    if line.count(player) == length and line.count(-player) == 0:
-                        # Check if either end is empty (open)
-                        pre = (r-dr, c-dc)
-                        post = (r+dr*length, c+dc*length)
-                        pre_ok = 0 <= pre[0] < BOARD_DIM and 0 <= pre[1] < BOARD_DIM and board[pre] == EMPTY
-                        post_ok = 0 <= post[0] < BOARD_DIM and 0 <= post[1] < BOARD_DIM and board[post] == EMPTY
-                        if pre_ok or post_ok:
-                            count += 1
-                except IndexError:
-                    continue
+    for line in lines:
+        # Ensure all cells belong to player
+        run = True
+        for i in range(1, length + 1):
+            if flat[line[i]] != player:
+                run = False
+                break
+        if not run:
+            continue
+        # Check if either end is empty (open)
+        pre, post = line[0], line[length + 1]
+        if (pre >= 0 and flat[pre] == EMPTY) or (post >= 0 and flat[post] == EMPTY):
+            count += 1
     return count
 
-def score_board(board, ai_player):
+def score_board(board, ai_player, stones):
+    # Score the board from AI player's perspective, reusing the result if this board was scored before
+    if stones[BLACK] < 2 and stones[WHITE] < 2:
+        return evaluate_board(board, ai_player, stones)  # No lines yet, scoring is cheaper than caching
+    cache_key = (board.tobytes(), ai_player)
+    score = eval_cache.get(cache_key)
+    if score is None:
+        if len(eval_cache) >= EVAL_CACHE_MAX_SIZE:
+            eval_cache.clear()
+        score = eval_cache[cache_key] = evaluate_board(board, ai_player, stones)
+    return score
+
+def evaluate_board(board, ai_player, stones):
     # Heuristic evaluation function to score the board state from AI player's perspective
-    if has_winner(board, ai_player):
-        return 1_000_000  # Max score if AI won
-    if has_winner(board, -ai_player):
-        return -1_000_000  # Min score if opponent won
+    # The searches score wins where the winning move is made, so boards scored here never have 5 in a row
 
     # Weights for lines of different lengths
     weights = {"four": 10000, "three": 1000, "two": 100}
     score = (
-        weights["four"] * count_lines(board, ai_player, 4) -
-        weights["four"] * 1.2 * count_lines(board, -ai_player, 4) +
-        weights["three"] * count_lines(board, ai_player, 3) -
-        weights["three"] * 1.5 * count_lines(board, -ai_player, 3) +
-        weights["two"] * count_lines(board, ai_player, 2) -
-        weights["two"] * 1.2 * count_lines(board, -ai_player, 2)
+        weights["four"] * count_lines(board, ai_player, LINES_4, stones) -
+        weights["four"] * 1.2 * count_lines(board, -ai_player, LINES_4, stones) +
+        weights["three"] * count_lines(board, ai_player, LINES_3, stones) -
+        weights["three"] * 1.5 * count_lines(board, -ai_player, LINES_3, stones) +
+        weights["two"] * count_lines(board, ai_player, LINES_2, stones) -
+        weights["two"] * 1.2 * count_lines(board, -ai_player, LINES_2, stones)
     )
 
-    # Bonus for pieces closer to center (better control)
-    center = BOARD_DIM // 2
-    for r in range(BOARD_DIM):
-        for c in range(BOARD_DIM):
-            weight = (7 - abs(center - r)) * (7 - abs(center - c))
-            if board[r, c] == ai_player:
-                score += 2 * weight
-            elif board[r, c] == -ai_player:
-                score -= 2 * weight
+    # Bonus for pieces closer to center (better control): +weight for AI pieces, -weight for opponent's
+    score += 2 * ai_player * int((CENTER_WEIGHT * board).sum())
     return score
 
-def alpha_beta(board, depth, alpha, beta, maximize, ai_player, current):
-    # Alpha-Beta pruning search algorithm to decide best move for AI
-    if depth == 0 or has_winner(board, ai_player) or has_winner(board, -ai_player) or not get_valid_moves(board):
-        return score_board(board, ai_player), None
-
-    best_moves = []
-    best_score = -float('inf') if maximize else float('inf')
-    moves = get_valid_moves(board)
-    move_scores = []
-
-    # Evaluate moves heuristically to sort and reduce branching
-    for move in moves:
-        board[move] = current
-        score = score_board(board, ai_player)
-        board[move] = EMPTY
-        move_scores.append((score, move))
-
-    # Sort moves based on evaluation (descending if maximizing)
-    move_scores.sort(reverse=maximize)
-    moves = [m for _, m in move_scores[:8]]  # Limit to top 8 moves
+def tt_store(tt_key, entry):
+    # Add an entry to the transposition table, evicting the oldest one when full
+    if len(transposition_table) >= TT_MAX_SIZE:
+        del transposition_table[next(iter(transposition_table))]  # Dicts keep insertion order, so this is the oldest
+    transposition_table[tt_key] = entry
+
+def order_moves(board, nbrs, current, first_move=None):
+    # Pick the moves to search for the player to move: top 8 by a cheap heuristic to reduce branching
+    cells = candidate_cells(board, nbrs)
+    if len(cells) > 8:
+        cells = cells[np.argpartition(-move_priorities(board, cells, current), 8)[:8]]
+    moves = [(r, c) for r, c in cells.tolist()]
     random.shuffle(moves)  # Shuffle to introduce randomness
-
-    # Search through moves recursively
-    for move in moves:
-        board[move] = current
-        eval_score, _ = alpha_beta(board, depth-1, alpha, beta, not maximize, ai_player, -current)
-        board[move] = EMPTY
-
-        if maximize:
-            if eval_score > best_score:
-                best_score = eval_score
-                best_moves = [move]
-            elif eval_score == best_score:
-                best_moves.append(move)
-            alpha = max(alpha, best_score)
+    if first_move is not None:
+        # Try the best move from an earlier search of this position first
+        moves = [first_move] + [m for m in moves if m != first_move]
+    return moves
+
+def negamax(board, nbrs, stones, depth, alpha, beta, ai_player, current, key=None):
+    # Alpha-Beta search in negamax form with Principal Variation Search (NegaScout)
+    # Scores are from the perspective of current, the player to move
+    # key is the Zobrist hash of the board, computed here at the root and updated incrementally below
+    color = 1 if current == ai_player else -1  # score_board is from AI player's perspective
+    if depth == 0:
+        return color * score_board(board, ai_player, stones), None
+    if key is None:
+        key = board_hash(board)
+
+    # Probe the transposition table: a deep enough entry may answer this node or narrow the window
+    tt_key = (key, ai_player, current)
+    tt_move = None
+    entry = transposition_table.get(tt_key)
+    if entry is not None:
+        tt_value, tt_depth, tt_flag, tt_move = entry
+        if tt_depth >= depth:
+            if tt_flag == TT_EXACT:
+                return tt_value, tt_move
+            elif tt_flag == TT_LOWER:
+                alpha = max(alpha, tt_value)
+            else:
+                beta = min(beta, tt_value)
+            if beta <= alpha:
+                return tt_value, tt_move
+    window = (alpha, beta)  # Window actually searched, used to classify the stored value
+
+    moves = order_moves(board, nbrs, current, tt_move)
+    if not moves:
+        return color * score_board(board, ai_player, stones), None  # Board is full
+
+    # Search the first move with the full window, then prove the others worse with null windows
+    best_score, best_move = -float('inf'), None
+    for i, move in enumerate(moves):
+        key = do_move(board, nbrs, stones, move, current, key)
+        if has_winner_at(board, *move, current, stones):
+            eval_score = WIN_SCORE  # This move makes 5 in a row, no need to search below it
+        elif i == 0:
+            eval_score = -negamax(board, nbrs, stones, depth-1, -beta, -alpha, ai_player, -current, key)[0]
         else:
-            if eval_score < best_score:
-                best_score = eval_score
-                best_moves = [move]
-            elif eval_score == best_score:
-                best_moves.append(move)
-            beta = min(beta, best_score)
-
+            eval_score = -negamax(board, nbrs, stones, depth-1, -alpha-1, -alpha, ai_player, -current, key)[0]
+            if alpha < eval_score < beta:
+                # Null window failed high: re-search with the full window to get the actual score
+                eval_score = -negamax(board, nbrs, stones, depth-1, -beta, -eval_score, ai_player, -current, key)[0]
+        key = undo_move(board, nbrs, stones, move, key)
+
+        if eval_score > best_score:
+            best_score, best_move = eval_score, move
+        alpha = max(alpha, best_score)
         if beta <= alpha:
             break  # Prune remaining branches
 
-    return best_score, random.choice(best_moves) if best_moves else None
+    # Store the result, flagged by where it fell relative to the searched window
+    if best_score <= window[0]:
+        flag = TT_UPPER
+    elif best_score >= window[1]:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    tt_store(tt_key, (best_score, depth, flag, best_move))
+
+    return best_score, best_move
+
+def search_root(board, nbrs, stones, max_depth, ai_player):
+    # Iterative deepening around the negamax search: each shallower pass fills the transposition table
+    # with best moves, which are searched first by the next, deeper pass
+    key = board_hash(board)
+    best_move = None
+    for depth in range(1, max_depth + 1):
+        _, move = negamax(board, nbrs, stones, depth, -float('inf'), float('inf'), ai_player, ai_player, key)
+        if move is not None:
+            best_move = move  # Keep the move from the deepest completed pass
+    return best_move
 
-def minimax(board, depth, maximize, ai_player, current):
+def minimax(board, nbrs, stones, depth, maximize, ai_player, current):
     # Simple minimax search without alpha-beta pruning
-    if depth == 0 or has_winner(board, ai_player) or has_winner(board, -ai_player) or not get_valid_moves(board):
-        return score_board(board, ai_player), None
+    if depth == 0:
+        return score_board(board, ai_player, stones), None
+    moves = get_valid_moves(board, nbrs)
+    if not moves:
+        return score_board(board, ai_player, stones), None  # Board is full
 
     best_score = -float('inf') if maximize else float('inf')
     best_moves = []
-    moves = get_valid_moves(board)
 
     for move in moves:
-        board[move] = current
-        eval_score, _ = minimax(board, depth-1, not maximize, ai_player, -current)
-        board[move] = EMPTY
+        do_move(board, nbrs, stones, move, current)
+        if has_winner_at(board, *move, current, stones):
+            eval_score = WIN_SCORE if current == ai_player else -WIN_SCORE  # Winning move, no need to search below it
+        else:
+            eval_score, _ = minimax(board, nbrs, stones, depth-1, not maximize, ai_player, -current)
+        undo_move(board, nbrs, stones, move)
 
         if maximize:
             if eval_score > best_score:
@@ -209,6 +384,8 @@ class GomokuUI:
         self.root = root
         clear_widgets(root)  # Clear any existing UI widgets
         self.board = init_board()  # Create empty board
+        self.neighbor_count = init_neighbors()  # Track cells adjacent to pieces for move generation
+        self.stones = init_stones()  # Track how many pieces each player has
         self.current_player = BLACK  # Human (Black) always starts first
         self.ai_mode = ai_vs_ai
 
@@ -231,7 +408,7 @@ class GomokuUI:
         self.status = Label(root, text=status_text, font=("Verdana", 14), bg='#228B22', fg='white')
         self.status.pack(fill=X)
 
-        self.draw_board()  # Draw initial empty board
+        self.draw_grid()  # Grid lines never change, so draw them once; pieces are added by draw_piece
 
         # If AI vs AI, start the AI loop immediately
         if ai_vs_ai:
@@ -243,12 +420,9 @@ class GomokuUI:
             self.status.config(text=f"O ({self.ai_white}) thinking...")
             self.root.after(100, self.run_ai_turn)
 
-    def draw_board(self):
-        # Clear and redraw the board grid and pieces
-        self.canvas.delete("all")
+    def draw_grid(self):
+        # Draw the board grid lines
         line_color = "#000000"  # Black grid lines
-
-        # Draw grid lines
         for i in range(BOARD_DIM):
             # Horizontal lines
             self.canvas.create_line(self.cell//2, self.cell//2 + i*self.cell,
@@ -259,28 +433,26 @@ class GomokuUI:
                                     self.cell//2 + i*self.cell, self.cell//2 + (BOARD_DIM-1)*self.cell,
                                     fill=line_color, width=2)
 
-        # Draw pieces (X and O)
-        for r in range(BOARD_DIM):
-            for c in range(BOARD_DIM):
-                piece = self.board[r, c]
-                if piece != EMPTY:
-                    x_center = c * self.cell + self.cell // 2
-                    y_center = r * self.cell + self.cell // 2
-                    if piece == BLACK:
-                        # Draw 'X' in white color inside cell
-                        offset = self.cell // 3
-                        self.canvas.create_line(x_center - offset, y_center - offset,
-                                                x_center + offset, y_center + offset,
-                                                fill="white", width=3)
-                        self.canvas.create_line(x_center - offset, y_center + offset,
-                                                x_center + offset, y_center - offset,
-                                                fill="white", width=3)
-                    else:
-                        # Draw 'O' as a white circle inside cell
-                        radius = self.cell // 3
-                        self.canvas.create_oval(x_center - radius, y_center - radius,
-                                                x_center + radius, y_center + radius,
-                                                outline="white", width=3)
+    def draw_piece(self, r, c):
+        # Draw the piece at (r, c), call after each move instead of redrawing the whole board
+        piece = self.board[r, c]
+        x_center = c * self.cell + self.cell // 2
+        y_center = r * self.cell + self.cell // 2
+        if piece == BLACK:
+            # Draw 'X' in white color inside cell
+            offset = self.cell // 3
+            self.canvas.create_line(x_center - offset, y_center - offset,
+                                    x_center + offset, y_center + offset,
+                                    fill="white", width=3)
+            self.canvas.create_line(x_center - offset, y_center + offset,
+                                    x_center + offset, y_center - offset,
+                                    fill="white", width=3)
+        else:
+            # Draw 'O' as a white circle inside cell
+            radius = self.cell // 3
+            self.canvas.create_oval(x_center - radius, y_center - radius,
+                                    x_center + radius, y_center + radius,
+                                    outline="white", width=3)
 
     def player_move(self, event):
         # Handle player's click to place a piece
@@ -288,9 +460,9 @@ class GomokuUI:
             return  # Ignore clicks if AI mode or not human's turn (black)
         c, r = event.x // self.cell, event.y // self.cell  # Get clicked cell
         if 0 <= r < BOARD_DIM and 0 <= c < BOARD_DIM and self.board[r, c] == EMPTY:
-            self.board[r, c] = BLACK  # Place black piece
-            self.draw_board()  # Redraw board with new piece
-            if has_winner(self.board, BLACK):
+            do_move(self.board, self.neighbor_count, self.stones, (r, c), BLACK)  # Place black piece
+            self.draw_piece(r, c)  # Draw the new piece
+            if has_winner_at(self.board, r, c, BLACK, self.stones):
                 self.declare_winner("X (Human)")  # Declare human win
             else:
                 self.current_player = WHITE  # Switch to AI turn
@@ -301,7 +473,7 @@ class GomokuUI:
         # Handle AI's move computation and placing piece
         if has_winner(self.board, -self.current_player):
             return  # Game over, do nothing
-        if not get_valid_moves(self.board):
+        if not get_valid_moves(self.board, self.neighbor_count):
             # No moves left, it's a draw
             self.status.config(text="Draw!")
             messagebox.showinfo("Game Over", "It's a draw!")
@@ -314,15 +486,15 @@ class GomokuUI:
 
         # Choose AI algorithm and get best move
         if ai_type == "Minimax":
-            _, move = minimax(self.board, AI_DEPTH, True, self.current_player, self.current_player)
+            _, move = minimax(self.board, self.neighbor_count, self.stones, AI_DEPTH, True, self.current_player, self.current_player)
         else:
             # Default to Alpha-Beta
-            _, move = alpha_beta(self.board, AI_DEPTH, -float('inf'), float('inf'), True, self.current_player, self.current_player)
+            move = search_root(self.board, self.neighbor_count, self.stones, AI_DEPTH, self.current_player)
 
         if move is not None:
-            self.board[move] = self.current_player
-            self.draw_board()
-            if has_winner(self.board, self.current_player):
+            do_move(self.board, self.neighbor_count, self.stones, move, self.current_player)
+            self.draw_piece(*move)
+            if has_winner_at(self.board, *move, self.current_player, self.stones):
                 winner = "X (AI Black)" if self.current_player == BLACK else "O (AI White)"
                 self.declare_winner(winner)
                 return